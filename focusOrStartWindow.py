@@ -2,7 +2,7 @@
 
 import sys
 import os
-import json
+import re
 import subprocess
 
 try:
@@ -12,21 +12,19 @@ except:
     print("Please enter 2 command line arguments")
     os._exit(1)
 
-output = json.loads(
-            subprocess.run(
-            ["hyprctl", "-j", "clients"],
+output = subprocess.run(
+            ["hyprctl", "clients"],
             capture_output = True,
             text = True
             ).stdout
-        )
 
-workspace = None
+window_exists = re.search(
+            rf"^\s*class: {re.escape(class_name)}$",
+            output,
+            re.MULTILINE
+            )
 
-for window in output:
-    if window["class"] == class_name:
-        workspace = window["workspace"]["id"]
-
-if workspace is None:
+if window_exists is None:
     subprocess.run(["hyprctl", "dispatch", "exec", exec_command])
 else:
     subprocess.run(["hyprctl", "dispatch", "focuswindow", f"class:{class_name}"])
@@ -6,8 +6,15 @@ from pathlib import Path
 import difflib
 import sys
 
+try:
+    from rapidfuzz import fuzz
+except ImportError:
+    fuzz = None
+
 journal_enabled = False
 
+SKIP_DIRS = {".git", "node_modules", ".venv", "target", "build", "__pycache__"}
+
 
 def send_err_log(msg: str):
     if journal_enabled:
@@ -17,6 +24,8 @@ def send_err_log(msg: str):
 def score_similarity(a, b):
     a = str(a)
     b = str(b)
+    if fuzz is not None:
+        return fuzz.ratio(a, b)
     return difflib.SequenceMatcher(None, a, b).ratio()
 
 
@@ -59,12 +68,6 @@ def main():
         )
         return
 
-    fps = [
-        os.path.relpath(os.path.join(root, file), start=cwd)
-        for root, _, files in os.walk(cwd)
-        for file in files
-    ]
-
     if curr_fp.endswith(".c") or curr_fp.endswith(".h"):
         c_mode = True
 
@@ -78,17 +81,25 @@ def main():
     if curr_fp.endswith("h" + "pp" * (not c_mode)):
         in_header = True
 
-    files_to_check = []
-
     # branchless programming!
     new_ext = "." + ("c" * in_header) + ("h" * (not in_header)) + ("pp" * (not c_mode))
 
-    for fp in fps:
-        # almost :(
-        if fp.endswith(new_ext):
-            files_to_check.append(Path(fp).with_suffix(""))
+    # usual case, counterpart sits right next to the current file
+    sibling = Path(curr_fp).with_suffix(new_ext)
+    if os.path.isfile(os.path.join(cwd, sibling)):
+        print(cwd + "/" + str(sibling))
+        return
+
+    files_to_check = []
+
+    for root, dirs, files in os.walk(cwd):
+        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+        for file in files:
+            if file.endswith(new_ext):
+                fp = os.path.relpath(os.path.join(root, file), start=cwd)
+                files_to_check.append(fp[: -len(new_ext)])
 
-    curr_fp_no_ext = Path(curr_fp).with_suffix("")
+    curr_fp_no_ext = os.path.splitext(curr_fp)[0]
     best_match = None
     best_score = -1
 